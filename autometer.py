@@ -1,10 +1,124 @@
+# requests (with urllib3 and friends) and dotenv are imported lazily
+# inside the functions that need them, so error paths exit without
+# paying ~100-200ms of cold-start import cost
+from __future__ import annotations
+
 import json
-import requests
 import sys
 import logging
 import os
+import queue
+import re
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from dotenv import load_dotenv
+
+try:
+    # orjson parses and serializes JSON several times faster than the
+    # stdlib; fall back to json so the script stays runnable without it
+    import orjson
+
+    def _json_loads(data: bytes) -> dict:
+        """Parse a JSON document with orjson."""
+        return orjson.loads(data)
+
+    def _json_dumps(obj: dict) -> str:
+        """Serialize an object to a JSON string with orjson."""
+        return orjson.dumps(obj).decode('ascii')
+
+    def _json_dump_bytes(obj: dict) -> bytes:
+        """Serialize an object to UTF-8 JSON bytes with orjson."""
+        return orjson.dumps(obj)
+except ImportError:
+    def _json_loads(data: bytes) -> dict:
+        """Parse a JSON document with the stdlib json module."""
+        return json.loads(data)
+
+    def _json_dumps(obj: dict) -> str:
+        """Serialize an object to a JSON string with the stdlib json module."""
+        return json.dumps(obj)
+
+    def _json_dump_bytes(obj: dict) -> bytes:
+        """Serialize an object to UTF-8 JSON bytes with the stdlib json module."""
+        return json.dumps(obj).encode('utf-8')
+
+
+# Module logger, resolved once instead of the root-logger lookup every
+# logging.* call performs
+logger = logging.getLogger(__name__)
+
+# Constant request metadata, built once at import time instead of on
+# every call
+_UA: str = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36'
+)
+_DEVICE_INFO: str = _json_dumps({
+    'appver': '1.40.0',
+    'type': 'browser',
+    'userAgent': _UA
+})
+_MOSENERGO_HEADERS: dict[str, str] = {
+    'Content-Type': 'application/x-www-form-urlencoded',
+    'User-Agent': _UA
+}
+_JSON_HEADERS: dict[str, str] = {'Content-Type': 'application/json'}
+
+# Required environment variables, keyed by the name used in the
+# env_vars dict returned by setup_environment
+_ENV_VARS: dict[str, str] = {
+    'login': 'LOGIN',
+    'log_file': 'LOG_FILE',
+    'saures_pass': 'SAURES_PASS',
+    'saures_api_url': 'SAURES_API_URL',
+    'meter_id': 'METER_ID',
+    'mosenergo_lk_url': 'MOSENERGO_LK_URL',
+    'mosenergo_pass': 'MOSENERGO_PASS',
+    'telegram_bot_token': 'TELEGRAM_BOT_TOKEN',
+    'telegram_chat_id': 'TELEGRAM_CHAT_ID',
+}
+
+# URL templates, filled with %-formatting on the hot path instead of
+# rebuilding f-strings per call
+_TELEGRAM_URL_TMPL: str = 'https://api.telegram.org/bot%s/sendMessage'
+_SAURES_LOGIN_URL_TMPL: str = '%s/login'
+_SAURES_METERS_URL_TMPL: str = '%s/object/meters?sid=%s&id=%s&date=%s'
+_MOSENERGO_LOGIN_URL_TMPL: str = '%s?action=auth&query=login'
+_MOSENERGO_LSLIST_URL_TMPL: str = '%s?action=sql&query=LSList&session=%s'
+_MOSENERGO_CALC_URL_TMPL: str = '%s?action=sql&query=bytProxy&session=%s'
+_MOSENERGO_SAVE_URL_TMPL: str = '%s?action=sql&query=SaveIndications&session=%s'
+
+# Dispatch table for send_mosenergo_data: query type -> URL template and
+# the payload fields specific to that operation
+_MOSENERGO_OPS: dict[str, tuple[str, dict[str, str]]] = {
+    'CalcCharge': (_MOSENERGO_CALC_URL_TMPL, {'proxyquery': 'CalcCharge'}),
+    'SaveIndications': (_MOSENERGO_SAVE_URL_TMPL, {}),
+}
+
+# HTML tags in Mosenergosbyt result messages, rewritten to Telegram
+# Markdown in a single compiled-regex pass
+_TG_TAG_RE: re.Pattern[str] = re.compile(r"<font color='#ff6347'>|</font>|<b>|</b>")
+_TG_TAG_MAP: dict[str, str] = {'<b>': '**', '</b>': '**'}
+
+
+def _check_response(response: requests.Response) -> None:
+    """Raise HTTPError for a 4xx/5xx response.
+
+    Cheaper than Response.raise_for_status, which decodes the reason
+    phrase on every call even for successful responses.
+
+    Args:
+        response (requests.Response): Response to check.
+
+    Raises:
+        requests.exceptions.HTTPError: If the status code is 400 or above.
+    """
+    import requests
+
+    if response.status_code >= 400:
+        raise requests.exceptions.HTTPError(
+            f'{response.status_code} Error for url: {response.url}', response=response
+        )
 
 
 def setup_environment() -> dict[str, str]:
@@ -16,85 +130,90 @@ def setup_environment() -> dict[str, str]:
     Raises:
         SystemExit: If any required environment variable is missing.
     """
+    from dotenv import load_dotenv
+
     load_dotenv()
-    required_env_vars: list[str] = [
-        'LOGIN',
-        'LOG_FILE',
-        'SAURES_PASS',
-        'SAURES_API_URL',
-        'METER_ID',
-        'MOSENERGO_LK_URL',
-        'MOSENERGO_PASS',
-        'TELEGRAM_BOT_TOKEN',
-        'TELEGRAM_CHAT_ID',
-    ]
-    missing_vars: list[str] = [var for var in required_env_vars if not os.environ.get(var)]
+    # One os.environ lookup per variable: build the result dict and the
+    # missing list from the same snapshot
+    env = os.environ
+    env_vars: dict[str, str] = {key: env.get(var, '') for key, var in _ENV_VARS.items()}
+    missing_vars: list[str] = [var for key, var in _ENV_VARS.items() if not env_vars[key]]
     if missing_vars:
-        logging.error('Missing environment variables: %s', ', '.join(missing_vars))
+        logger.error('Missing environment variables: %s', ', '.join(missing_vars))
         sys.exit(1)
-    
-    return {
-        'login': os.environ.get('LOGIN', ''),
-        'log_file': os.environ.get('LOG_FILE', ''),
-        'saures_pass': os.environ.get('SAURES_PASS', ''),
-        'saures_api_url': os.environ.get('SAURES_API_URL', ''),
-        'meter_id': os.environ.get('METER_ID', ''),
-        'mosenergo_lk_url': os.environ.get('MOSENERGO_LK_URL', ''),
-        'mosenergo_pass': os.environ.get('MOSENERGO_PASS', ''),
-        'telegram_bot_token': os.environ.get('TELEGRAM_BOT_TOKEN', ''),
-        'telegram_chat_id': os.environ.get('TELEGRAM_CHAT_ID', ''),
-    }
 
+    return env_vars
+
+
+def setup_logging(log_file_path: str = '/var/log/autometer.log') -> QueueListener:
+    """Configure non-blocking logging with the specified log file path.
+
+    Records are enqueued by the callers and written to disk by a
+    background listener thread, so the HTTP pipeline never blocks on
+    file I/O.
 
-def setup_logging(log_file_path: str = '/var/log/autometer.log') -> None:
-    """Configure logging with the specified log file path.
-    
     Args:
         log_file_path (str): Path to the log file. Defaults to '/var/log/autometer.log'.
-    """
-    logging.basicConfig(
-        filename=log_file_path,
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s'
-    )
 
-
-def send_telegram_message(token: str, chat_id: str, text: str) -> bool:
+    Returns:
+        QueueListener: Started listener; stop it before the script exits
+            to flush queued records.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    file_handler = RotatingFileHandler(log_file_path, maxBytes=10_000_000, backupCount=3)
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(QueueHandler(log_queue))
+    return listener
+
+
+def send_telegram_message(session: requests.Session, token: str, chat_id: str, text: str) -> bool:
     """Send a message via Telegram Bot API.
-    
+
     Args:
+        session (requests.Session): Shared session for connection reuse.
         token (str): Telegram Bot API token.
         chat_id (str): Chat ID of the recipient.
         text (str): Message text to send.
-    
+
     Returns:
         bool: True if message was sent successfully, False otherwise.
     """
-    url: str = f"https://api.telegram.org/bot{token}/sendMessage"
+    import requests
+
+    url: str = _TELEGRAM_URL_TMPL % token
     payload: dict[str, str] = {
         'chat_id': chat_id,
         'text': text,
         'parse_mode': 'Markdown'
     }
     try:
-        response = requests.post(url, data=payload)
-        response.raise_for_status()
-        result: dict = response.json()
+        # Telegram accepts JSON bodies; a pre-encoded bytes body skips
+        # requests' Python-level field encoding entirely (orjson emits
+        # UTF-8 bytes directly)
+        response = session.post(url, data=_json_dump_bytes(payload),
+                                headers=_JSON_HEADERS, allow_redirects=False)
+        _check_response(response)
+        result: dict = _json_loads(response.content)
         if result.get('ok'):
-            logging.info('Telegram message sent successfully to chat_id %s', chat_id)
+            logger.info('Telegram message sent successfully to chat_id %s', chat_id)
             return True
         else:
-            logging.error('Failed to send Telegram message: %s', result.get('description', 'Unknown error'))
+            logger.error('Failed to send Telegram message: %s', result.get('description', 'Unknown error'))
             return False
     except requests.exceptions.RequestException as e:
-        logging.error('Error sending Telegram message: %s', str(e))
+        logger.error('Error sending Telegram message: %s', str(e))
         return False
 
 
-def authenticate_saures(api_url: str, login: str, password: str) -> str:
+def authenticate_saures(session: requests.Session, api_url: str, login: str, password: str) -> str:
     """Authenticate with Saures API and retrieve session ID.
-    
+
     Args:
+        session (requests.Session): Shared session for connection reuse.
         api_url (str): Base URL of the Saures API.
         login (str): User login for authentication.
         password (str): User password for authentication.
@@ -105,7 +224,9 @@ def authenticate_saures(api_url: str, login: str, password: str) -> str:
     Raises:
         SystemExit: If authentication fails or an error occurs.
     """
-    saures_login_url: str = f'{api_url}/login'
+    import requests
+
+    saures_login_url: str = _SAURES_LOGIN_URL_TMPL % api_url
     headers: dict[str, str] = {
         'Content-Type': 'application/x-www-form-urlencoded; charset=utf-8'
     }
@@ -114,28 +235,31 @@ def authenticate_saures(api_url: str, login: str, password: str) -> str:
         'password': password
     }
 
-    logging.info('Connecting to Saures API for authentication')
+    logger.info('Connecting to Saures API for authentication')
     try:
-        response = requests.post(saures_login_url, headers=headers, data=data)
-        response.raise_for_status()
-        result: dict = response.json()
+        response = session.post(saures_login_url, headers=headers, data=data,
+                                allow_redirects=False)
+        _check_response(response)
+        result: dict = _json_loads(response.content)
         if result.get('status') == 'ok':
             return result['data']['sid']
         else:
-            logging.error('Authentication error: %s', result.get('errors', []))
+            logger.error('Authentication error: %s', result.get('errors', []))
             sys.exit(1)
     except requests.exceptions.RequestException as e:
-        logging.error('Request to Saures API failed: %s', str(e))
+        logger.error('Request to Saures API failed: %s', str(e))
         sys.exit(1)
     except (ValueError, KeyError) as e:
-        logging.error('Error processing Saures API response: %s', str(e))
+        logger.error('Error processing Saures API response: %s', str(e))
         sys.exit(1)
 
 
-def fetch_saures_meter_data(api_url: str, sid: str, meter_id: str, current_time: str) -> dict:
+def fetch_saures_meter_data(session: requests.Session, api_url: str, sid: str, meter_id: str,
+                            current_time: str) -> dict:
     """Fetch meter data from Saures API.
-    
+
     Args:
+        session (requests.Session): Shared session for connection reuse.
         api_url (str): Base URL of the Saures API.
         sid (str): Session ID for authentication.
         meter_id (str): ID of the meter to fetch data for.
@@ -147,23 +271,25 @@ def fetch_saures_meter_data(api_url: str, sid: str, meter_id: str, current_time:
     Raises:
         SystemExit: If request fails or response is invalid.
     """
-    saures_meters_url: str = f'{api_url}/object/meters?sid={sid}&id={meter_id}&date={current_time}'
-    logging.info('Fetching meter data from Saures API')
+    import requests
+
+    saures_meters_url: str = _SAURES_METERS_URL_TMPL % (api_url, sid, meter_id, current_time)
+    logger.info('Fetching meter data from Saures API')
     try:
-        response = requests.get(saures_meters_url)
-        response.raise_for_status()
-        result: dict = response.json()
+        response = session.get(saures_meters_url, allow_redirects=False)
+        _check_response(response)
+        result: dict = _json_loads(response.content)
         if result.get('status') == 'ok':
-            logging.info('Successfully retrieved meter data from Saures')
+            logger.info('Successfully retrieved meter data from Saures')
             return result['data']
         else:
-            logging.error('Failed to fetch meter data: %s', result.get('errors', []))
+            logger.error('Failed to fetch meter data: %s', result.get('errors', []))
             sys.exit(1)
     except requests.exceptions.RequestException as e:
-        logging.error('Request to fetch meter data failed: %s', str(e))
+        logger.error('Request to fetch meter data failed: %s', str(e))
         sys.exit(1)
     except (ValueError, KeyError) as e:
-        logging.error('Error processing meter data response: %s', str(e))
+        logger.error('Error processing meter data response: %s', str(e))
         sys.exit(1)
 
 
@@ -176,66 +302,62 @@ def get_electricity_vals(data: dict) -> list[float]:
     Returns:
         list[float]: List of rounded electricity values or empty list if not found.
     """
-    for sensor in data.get('sensors', []):
-        for meter in sensor.get('meters', []):
-            if meter.get('type', {}).get('name') == 'Электричество':
-                return [round(val) for val in meter.get('vals', [])]
-    return []
+    # Walk sensors/meters lazily and stop at the first electricity meter
+    meter: dict | None = next(
+        (meter
+         for sensor in data.get('sensors', [])
+         for meter in sensor.get('meters', [])
+         if meter.get('type', {}).get('name') == 'Электричество'),
+        None
+    )
+    if meter is None:
+        return []
+    # map dispatches round in C without per-iteration frame overhead
+    return list(map(round, meter.get('vals', ())))
 
 
-def authenticate_mosenergo(lk_url: str, login: str, password: str) -> tuple[str, requests.Session]:
+def authenticate_mosenergo(session: requests.Session, lk_url: str, login: str, password: str) -> str:
     """Authenticate with Mosenergosbyt API and retrieve session ID.
-    
+
     Args:
+        session (requests.Session): Shared session for connection reuse.
         lk_url (str): Base URL of the Mosenergosbyt API.
         login (str): User login for authentication.
         password (str): User password for authentication.
-    
+
     Returns:
-        tuple[str, requests.Session]: Session ID and requests.Session object if authentication is successful.
-    
+        str: Session ID if authentication is successful.
+
     Raises:
         SystemExit: If authentication fails or an error occurs.
     """
-    login_url: str = f'{lk_url}?action=auth&query=login'
+    import requests
+
+    login_url: str = _MOSENERGO_LOGIN_URL_TMPL % lk_url
     payload: dict[str, str] = {
         'login': login,
         'psw': password,
-        'vl_device_info': json.dumps({
-            'appver': '1.40.0',
-            'type': 'browser',
-            'userAgent': (
-                'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
-                '(KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36'
-            )
-        })
-    }
-    headers: dict[str, str] = {
-        'Content-Type': 'application/x-www-form-urlencoded',
-        'User-Agent': (
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
-            '(KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36'
-        )
+        'vl_device_info': _DEVICE_INFO
     }
+    headers: dict[str, str] = _MOSENERGO_HEADERS
 
-    logging.info('Trying to establish Mosenergosbyt session')
-    session = requests.Session()
+    logger.info('Trying to establish Mosenergosbyt session')
     try:
-        response = session.post(login_url, data=payload, headers=headers)
-        response.raise_for_status()
-        result: dict = response.json()
+        response = session.post(login_url, data=payload, headers=headers, allow_redirects=False)
+        _check_response(response)
+        result: dict = _json_loads(response.content)
         if result.get('success'):
             session_id: str = result['data'][0]['session']
-            logging.info('Successfully authenticated with Mosenergosbyt')
-            return session_id, session
+            logger.info('Successfully authenticated with Mosenergosbyt')
+            return session_id
         else:
-            logging.error('Connection to Mosenergosbyt failed: %s', result.get('error', 'Unknown error'))
+            logger.error('Connection to Mosenergosbyt failed: %s', result.get('error', 'Unknown error'))
             sys.exit(1)
     except requests.exceptions.RequestException as e:
-        logging.error('Request to Mosenergosbyt failed: %s', str(e))
+        logger.error('Request to Mosenergosbyt failed: %s', str(e))
         sys.exit(1)
     except (ValueError, KeyError) as e:
-        logging.error('Error processing Mosenergosbyt response: %s', str(e))
+        logger.error('Error processing Mosenergosbyt response: %s', str(e))
         sys.exit(1)
 
 
@@ -255,24 +377,26 @@ def fetch_mosenergo_provider(lk_url: str, session_id: str, session: requests.Ses
     Raises:
         SystemExit: If request fails or response is invalid.
     """
-    session_url: str = f'{lk_url}?action=sql&query=LSList&session={session_id}'
-    logging.info('Fetching provider data from Mosenergosbyt')
+    import requests
+
+    session_url: str = _MOSENERGO_LSLIST_URL_TMPL % (lk_url, session_id)
+    logger.info('Fetching provider data from Mosenergosbyt')
     try:
-        response = session.post(session_url, headers=headers)
-        response.raise_for_status()
-        result: dict = response.json()
+        response = session.post(session_url, headers=headers, allow_redirects=False)
+        _check_response(response)
+        result: dict = _json_loads(response.content)
         if result.get('success'):
             provider_id: str = result['data'][0]['vl_provider']
-            logging.info('Successfully retrieved provider ID from Mosenergosbyt')
+            logger.info('Successfully retrieved provider ID from Mosenergosbyt')
             return provider_id
         else:
-            logging.error('Failed to fetch provider data: %s', result.get('error', 'Unknown error'))
+            logger.error('Failed to fetch provider data: %s', result.get('error', 'Unknown error'))
             sys.exit(1)
     except requests.exceptions.RequestException as e:
-        logging.error('Request to fetch provider data failed: %s', str(e))
+        logger.error('Request to fetch provider data failed: %s', str(e))
         sys.exit(1)
     except (ValueError, KeyError) as e:
-        logging.error('Error processing provider data response: %s', str(e))
+        logger.error('Error processing provider data response: %s', str(e))
         sys.exit(1)
 
 
@@ -297,47 +421,81 @@ def send_mosenergo_data(lk_url: str, session_id: str, session: requests.Session,
     Raises:
         SystemExit: If request fails.
     """
-    if query_type == 'CalcCharge':
-        url: str = f'{lk_url}?action=sql&query=bytProxy&session={session_id}'
-        payload_base.update({
-            'proxyquery': 'CalcCharge',
-            'vl_provider': provider_id,
-            'vl_t1': electricity_values[0],
-            'vl_t2': electricity_values[1]
-        })
-    else:  # SaveIndications
-        url: str = (
-            f'{lk_url}?action=sql&query=SaveIndications&'
-            f'session={session_id}'
-        )
-        payload_base.update({
-            'vl_provider': provider_id,
-            'vl_t1': electricity_values[0],
-            'vl_t2': electricity_values[1]
-        })
-
-    logging.info('Sending data to Mosenergosbyt (%s)', query_type)
+    import requests
+
+    url_tmpl, extra_fields = _MOSENERGO_OPS[query_type]
+    url: str = url_tmpl % (lk_url, session_id)
+    payload_base.update(extra_fields)
+    payload_base.update({
+        'vl_provider': provider_id,
+        'vl_t1': electricity_values[0],
+        'vl_t2': electricity_values[1]
+    })
+
+    logger.info('Sending data to Mosenergosbyt (%s)', query_type)
     try:
-        response = session.post(url, headers=headers, data=payload_base)
-        response.raise_for_status()
-        result: dict = response.json()
-        logging.info('%s response: %s', query_type, result)
+        response = session.post(url, headers=headers, data=payload_base, allow_redirects=False)
+        _check_response(response)
+        result: dict = _json_loads(response.content)
+        # Full responses are kilobytes; only repr them at DEBUG level
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('%s response: %s', query_type, result)
+        else:
+            logger.info('%s completed (success=%s)', query_type, result.get('success'))
         return result
     except requests.exceptions.RequestException as e:
-        logging.error('%s request failed: %s', query_type, str(e))
+        logger.error('%s request failed: %s', query_type, str(e))
         if hasattr(e, 'response') and e.response is not None:
-            logging.error('Response content: %s', e.response.text)
+            logger.error('Response content: %s', e.response.text)
         return None
 
 
 def main() -> None:
     """Main function to orchestrate the automation process."""
-    # Load environment variables
+    # Load environment variables before pulling in the HTTP stack, so a
+    # misconfigured environment exits without importing it
     env_vars: dict[str, str] = setup_environment()
 
-    setup_logging(log_file_path=env_vars['log_file'])
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    # Bind env values to locals once: LOAD_FAST instead of a dict
+    # hash+lookup at every use below
+    login: str = env_vars['login']
+    saures_api_url: str = env_vars['saures_api_url']
+    saures_pass: str = env_vars['saures_pass']
+    meter_id: str = env_vars['meter_id']
+    mosenergo_lk_url: str = env_vars['mosenergo_lk_url']
+    mosenergo_pass: str = env_vars['mosenergo_pass']
+    telegram_bot_token: str = env_vars['telegram_bot_token']
+    telegram_chat_id: str = env_vars['telegram_chat_id']
+
+    log_listener: QueueListener = setup_logging(log_file_path=env_vars['log_file'])
     current_time: str = datetime.now().strftime('%Y-%m-%dT%H:%M:%S')
-    logging.info('Script started at: %s', current_time)
+    logger.info('Script started at: %s', current_time)
+
+    # Single session shared by all HTTP calls so urllib3's pool keeps
+    # TCP+TLS connections alive between requests to the same host.
+    # Transient 5xx responses are retried with backoff instead of
+    # aborting the whole run.
+    # HTTP/2 multiplexing (httpx) was evaluated for the concurrent
+    # Mosenergosbyt pair but would replace this requests/urllib3 stack;
+    # parallel HTTP/1.1 keep-alive connections from the pool cover the
+    # same two-requests-in-flight case
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=10,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(['GET', 'POST'])
+        )
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
 
     # Initialize variables for results and errors
     calc_response: dict | None = None
@@ -345,37 +503,36 @@ def main() -> None:
     success: bool = False
     error_message: str = ""
 
-    try:
-        # Authenticate with Saures and fetch meter data
-        saures_sid: str = authenticate_saures(
-            env_vars['saures_api_url'], env_vars['login'], env_vars['saures_pass']
-        )
+    headers: dict[str, str] = _MOSENERGO_HEADERS
+
+    def saures_chain() -> list[float]:
+        """Authenticate with Saures, fetch meter data and extract values."""
+        saures_sid: str = authenticate_saures(session, saures_api_url, login, saures_pass)
         meters_data: dict = fetch_saures_meter_data(
-            env_vars['saures_api_url'], saures_sid, env_vars['meter_id'], current_time
+            session, saures_api_url, saures_sid, meter_id, current_time
         )
-        
-        # Extract electricity values
-        electricity_values: list[float] = get_electricity_vals(meters_data)
+        return get_electricity_vals(meters_data)
+
+    def mosenergo_chain() -> tuple[str, str]:
+        """Authenticate with Mosenergosbyt and fetch the provider ID."""
+        session_id: str = authenticate_mosenergo(session, mosenergo_lk_url, login, mosenergo_pass)
+        provider_id: str = fetch_mosenergo_provider(mosenergo_lk_url, session_id, session, headers)
+        return session_id, provider_id
+
+    try:
+        # The Saures and Mosenergosbyt chains have no data dependency
+        # until the send step, so run both concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            saures_future = executor.submit(saures_chain)
+            mosenergo_future = executor.submit(mosenergo_chain)
+            electricity_values: list[float] = saures_future.result()
+            session_id, provider_id = mosenergo_future.result()
+
         if len(electricity_values) < 2:
-            logging.error('Not enough electricity values received: %s', electricity_values)
+            logger.error('Not enough electricity values received: %s', electricity_values)
             error_message = 'Not enough electricity values received.'
             raise ValueError(error_message)
-        logging.info('Extracted electricity values: %s', electricity_values)
-
-        # Authenticate with Mosenergosbyt and fetch provider data
-        session_id, session = authenticate_mosenergo(
-            env_vars['mosenergo_lk_url'], env_vars['login'], env_vars['mosenergo_pass']
-        )
-        headers: dict[str, str] = {
-            'Content-Type': 'application/x-www-form-urlencoded',
-            'User-Agent': (
-                'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
-                '(KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36'
-            )
-        }
-        provider_id: str = fetch_mosenergo_provider(
-            env_vars['mosenergo_lk_url'], session_id, session, headers
-        )
+        logger.info('Extracted electricity values: %s', electricity_values)
 
         # Send data to Mosenergosbyt and collect results for notification
         calc_payload: dict = {
@@ -387,22 +544,28 @@ def main() -> None:
             'plugin': 'propagateMesInd',
             'pr_flat_meter': 0
         }
-        calc_response = send_mosenergo_data(
-            env_vars['mosenergo_lk_url'], session_id, session, headers, provider_id,
-            electricity_values, 'CalcCharge', calc_payload
-        )
-        save_response = send_mosenergo_data(
-            env_vars['mosenergo_lk_url'], session_id, session, headers, provider_id,
-            electricity_values, 'SaveIndications', save_payload
-        )
+        # Both sends depend only on provider_id and the values, so
+        # dispatch them in parallel over the pooled session
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            calc_future = executor.submit(
+                send_mosenergo_data, mosenergo_lk_url, session_id, session,
+                headers, provider_id, electricity_values, 'CalcCharge', calc_payload
+            )
+            save_future = executor.submit(
+                send_mosenergo_data, mosenergo_lk_url, session_id, session,
+                headers, provider_id, electricity_values, 'SaveIndications', save_payload
+            )
+            calc_response = calc_future.result()
+            save_response = save_future.result()
 
         # Check if both operations were successful
         if calc_response and save_response and calc_response.get('success') and save_response.get('success'):
             success = True
             calc_result: str = calc_response['data'][0].get('nm_result', 'No result message available')
-            # Remove HTML-tags and bold tags
-            calc_result_cleaned = calc_result.replace("<font color='#ff6347'>", "").replace("</font>", "")
-            calc_result_cleaned = calc_result_cleaned.replace("<b>", "**").replace("</b>", "**")
+            # Remove HTML-tags and rewrite bold tags to Markdown
+            calc_result_cleaned = _TG_TAG_RE.sub(
+                lambda match: _TG_TAG_MAP.get(match.group(0), ''), calc_result
+            )
             save_result: str = save_response['data'][0].get('nm_result', 'No result message available')
             message: str = (
                 '✅ *Mosenergosbyt Operation Success*\n\n'
@@ -418,7 +581,7 @@ def main() -> None:
             )
 
     except Exception as e:
-        logging.error('Unexpected error in script execution: %s', str(e))
+        logger.error('Unexpected error in script execution: %s', str(e))
         success = False
         error_message = str(e)
         message: str = (
@@ -427,18 +590,20 @@ def main() -> None:
         )
 
     finally:
-        # Send Telegram notification regardless of success or failure
-        for id_ in env_vars['telegram_chat_id'].split(','):
-            send_telegram_message(
-                env_vars['telegram_bot_token'], id_, message
-            )
+        # Send Telegram notification regardless of success or failure;
+        # sends are independent network calls, so overlap them in threads
+        chat_ids: list[str] = [id_ for id_ in telegram_chat_id.split(',') if id_]
+        if chat_ids:
+            with ThreadPoolExecutor(max_workers=min(8, len(chat_ids))) as executor:
+                list(executor.map(
+                    lambda id_: send_telegram_message(session, telegram_bot_token, id_, message),
+                    chat_ids
+                ))
 
         # Clean up
-        try:
-            session.close()
-        except NameError:
-            pass
-        logging.info('Script completed with status: %s', 'Success' if success else 'Failure')
+        session.close()
+        logger.info('Script completed with status: %s', 'Success' if success else 'Failure')
+        log_listener.stop()
         
 if __name__ == '__main__':
     main()